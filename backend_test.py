@@ -16,6 +16,14 @@ class ProjectHubAPITester:
         self.tests_run = 0
         self.tests_passed = 0
         self.session = requests.Session()
+        # Larger keep-alive pool so sequential tests reuse connections and
+        # transient connection errors are retried
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=50, pool_maxsize=50,
+            max_retries=requests.adapters.Retry(total=2, backoff_factor=0.1)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
         """Run a single API test"""
@@ -6,6 +6,7 @@ Tests all demo accounts to verify login functionality
 
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Backend URL
 BACKEND_URL = "http://localhost:8001"
@@ -18,6 +19,21 @@ DEMO_USERS = [
     {"email": "stakeholder@projecthub.com", "password": "demo123", "role": "Stakeholder"},
 ]
 
+def attempt_login(session, user):
+    """Run one login attempt; returns the response or the raised exception"""
+    form_data = {
+        'username': user['email'],
+        'password': user['password']
+    }
+    try:
+        return session.post(
+            f"{BACKEND_URL}/api/auth/login",
+            data=form_data,
+            timeout=10
+        )
+    except Exception as e:
+        return e
+
 def test_demo_users():
     """Test login for all demo users"""
     print("🧪 ProjectHub Demo Login Verification")
@@ -25,40 +41,31 @@ def test_demo_users():
     
     success_count = 0
     
-    for user in DEMO_USERS:
+    # One keep-alive session, all logins in flight at once; results are
+    # printed in order afterwards
+    session = requests.Session()
+    with ThreadPoolExecutor(max_workers=len(DEMO_USERS)) as pool:
+        responses = list(pool.map(lambda u: attempt_login(session, u), DEMO_USERS))
+    
+    for user, response in zip(DEMO_USERS, responses):
         print(f"\n🔍 Testing: {user['role']} ({user['email']})")
         
-        # Prepare form data
-        form_data = {
-            'username': user['email'],
-            'password': user['password']
-        }
-        
-        try:
-            # Make login request
-            response = requests.post(
-                f"{BACKEND_URL}/api/auth/login",
-                data=form_data,
-                timeout=10
-            )
+        if isinstance(response, Exception):
+            print(f"  💥 ERROR: {str(response)}")
+        elif response.status_code == 200:
+            data = response.json()
+            user_info = data.get('user', {})
             
-            if response.status_code == 200:
-                data = response.json()
-                user_info = data.get('user', {})
-                
-                print(f"  ✅ LOGIN SUCCESS")
-                print(f"  👤 User: {user_info.get('full_name')}")
-                print(f"  🏷️  Role: {user_info.get('role')}")
-                print(f"  🏢 Dept: {user_info.get('department')}")
-                print(f"  🔑 Token: {data.get('access_token', '')[:50]}...")
-                
-                success_count += 1
-            else:
-                print(f"  ❌ LOGIN FAILED: {response.status_code}")
-                print(f"  📋 Response: {response.text}")
-                
-        except Exception as e:
-            print(f"  💥 ERROR: {str(e)}")
+            print(f"  ✅ LOGIN SUCCESS")
+            print(f"  👤 User: {user_info.get('full_name')}")
+            print(f"  🏷️  Role: {user_info.get('role')}")
+            print(f"  🏢 Dept: {user_info.get('department')}")
+            print(f"  🔑 Token: {data.get('access_token', '')[:50]}...")
+            
+            success_count += 1
+        else:
+            print(f"  ❌ LOGIN FAILED: {response.status_code}")
+            print(f"  📋 Response: {response.text}")
     
     print(f"\n📊 RESULTS:")
     print(f"  ✅ Successful logins: {success_count}/{len(DEMO_USERS)}")